@@ -0,0 +1,44 @@
+"""Serves the project from a single long running process.
+
+Intended for development and small deployments; production deployments
+should run `sserver.server.application` under a WSGI server such as
+gunicorn or uwsgi.
+
+Example:
+    $ python -m sserver --host 127.0.0.1 --port 8000
+"""
+
+import argparse
+from wsgiref.simple_server import make_server
+from sserver import server
+from sserver.util import log
+
+
+def main():
+    """Parse the command line arguments and serve until interrupted."""
+
+    argument_parser = argparse.ArgumentParser(prog='sserver')
+    argument_parser.add_argument('--host', default='127.0.0.1')
+    argument_parser.add_argument('--port', type=int, default=8000)
+    arguments = argument_parser.parse_args()
+
+    # Load everything before accepting requests, so the first request
+    # does not pay for it
+    server.initialize()
+
+    with make_server(
+        arguments.host,
+        arguments.port,
+        server.application,
+    ) as httpd:
+        log.info(f'Serving on http://{arguments.host}:{arguments.port}')
+
+        try:
+            httpd.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""Provides an ASGI interface to the server.
+
+The WSGI application is run in the event loops default executor, so
+blocking endpoints do not stall other requests being served by the loop.
+"""
+
+import asyncio
+import io
+from typing import Any, Callable, Dict, List, Tuple
+from sserver import server
+
+
+# Alias for an ASGI scope and message
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+
+
+async def application(scope: Scope, receive: Callable, send: Callable):
+    """Handle an ASGI connection.
+
+    Args:
+        scope (`Scope`): The connection scope.
+        receive (`Callable`): Awaitable callable to receive messages.
+        send (`Callable`): Awaitable callable to send messages.
+
+    Raises:
+        ValueError: If the scope type is not supported.
+    """
+
+    scope_type = scope['type']
+
+    if scope_type == 'lifespan':
+        await handle_lifespan(receive, send)
+
+    elif scope_type == 'http':
+        await handle_http(scope, receive, send)
+
+    else:
+        raise ValueError(f'Unsupported scope type: {scope_type}')
+
+
+async def handle_lifespan(receive: Callable, send: Callable):
+    """Handle lifespan events, initializing the server on startup.
+
+    Note:
+        If initializing fails, startup is reported as failed with the
+        error message and no further lifespan events are handled.
+
+    Args:
+        receive (`Callable`): Awaitable callable to receive messages.
+        send (`Callable`): Awaitable callable to send messages.
+    """
+
+    loop = asyncio.get_event_loop()
+
+    while True:
+        message = await receive()
+
+        if message['type'] == 'lifespan.startup':
+            try:
+                await loop.run_in_executor(None, server.initialize)
+
+            except Exception as e:
+                await send({
+                    'type': 'lifespan.startup.failed',
+                    'message': str(e),
+                })
+                return
+
+            await send({'type': 'lifespan.startup.complete'})
+
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def handle_http(scope: Scope, receive: Callable, send: Callable):
+    """Handle a HTTP request.
+
+    Args:
+        scope (`Scope`): The connection scope.
+        receive (`Callable`): Awaitable callable to receive messages.
+        send (`Callable`): Awaitable callable to send messages.
+    """
+
+    request_body = await read_request_body(receive)
+    environment = get_environment(scope, request_body)
+
+    loop = asyncio.get_event_loop()
+
+    status, headers, content = await loop.run_in_executor(
+        None,
+        get_wsgi_response,
+        environment,
+    )
+
+    await send({
+        'type': 'http.response.start',
+        'status': int(status.split(' ', 1)[0]),
+        'headers': [
+            (key.encode('latin-1'), value.encode('latin-1'))
+            for key, value in headers
+        ],
+    })
+
+    await send({
+        'type': 'http.response.body',
+        'body': content,
+    })
+
+
+async def read_request_body(receive: Callable) -> bytes:
+    """Read the full request body.
+
+    Args:
+        receive (`Callable`): Awaitable callable to receive messages.
+
+    Returns:
+        `bytes`: The request body.
+    """
+
+    body_list = []
+
+    while True:
+        message = await receive()
+
+        # Stop reading if the client disconnects
+        if message['type'] != 'http.request':
+            break
+
+        body_list.append(message.get('body', b''))
+
+        if not message.get('more_body', False):
+            break
+
+    return b''.join(body_list)
+
+
+def get_environment(scope: Scope, request_body: bytes) -> Dict[str, Any]:
+    """Build a WSGI environment dict from an ASGI scope.
+
+    Args:
+        scope (`Scope`): The connection scope.
+        request_body (`bytes`): The request body.
+
+    Returns:
+        `Dict[str, Any]`: The WSGI environment.
+    """
+
+    path = scope['path']
+    query_string = scope.get('query_string', b'').decode('latin-1')
+
+    request_uri = path
+
+    if query_string:
+        request_uri = f'{path}?{query_string}'
+
+    environment = {
+        'REQUEST_METHOD': scope['method'],
+        'PATH_INFO': path,
+        'REQUEST_URI': request_uri,
+        'QUERY_STRING': query_string,
+        'CONTENT_LENGTH': str(len(request_body)),
+        'wsgi.input': io.BytesIO(request_body),
+    }
+
+    for key, value in scope.get('headers', []):
+        key = key.decode('latin-1').upper().replace('-', '_')
+
+        if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            key = f'HTTP_{key}'
+
+        environment.setdefault(key, value.decode('latin-1'))
+
+    return environment
+
+
+def get_wsgi_response(environment: Dict[str, Any]
+                      ) -> Tuple[str, List[Tuple[str, str]], bytes]:
+    """Get the WSGI applications response to `environment`.
+
+    Args:
+        environment (`Dict[str, Any]`): The WSGI environment.
+
+    Returns:
+        `Tuple[str, List[Tuple[str, str]], bytes]`: The response status,
+            headers and content.
+    """
+
+    response = {}
+
+    def start_response(status: str, headers: List[Tuple[str, str]]):
+        response['status'] = status
+        response['headers'] = headers
+
+    content = b''.join(server.application(environment, start_response))
+
+    return response['status'], response['headers'], content
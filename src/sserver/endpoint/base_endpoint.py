@@ -139,7 +139,14 @@ class BaseEndpoint(OptionMixin):
               'boolkey' : True, 'emptykey' : None }
         """
 
-        return config.get_app_config(self.get_app_name())
+        app_config = config.get_app_config(self.get_app_name())
+
+        # Copy the shared config so callers are free to modify it, a
+        # shallow copy is valid as app configs are never nested
+        if app_config is not None:
+            app_config = app_config.copy()
+
+        return app_config
 
     def get_from_config(
             self, *key_list: str, default: Any = None
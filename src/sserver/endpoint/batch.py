@@ -0,0 +1,227 @@
+"""Provides request batching for endpoint methods.
+
+Endpoints that do expensive per call work, such as database round trips
+or model inference, can handle concurrent requests together by
+decorating a method with `batchable`. The decorated method is written
+to take a list of requests and return a list of responses, and is
+called with single requests as usual.
+
+Example:
+    >>> class ModelEndpoint(BaseEndpoint):
+    ...     @batchable(max_batch_size=8, max_wait_ms=5)
+    ...     def post(self, request_list):
+    ...         return [predict(request) for request in request_list]
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, List, Optional
+
+
+class _PendingRequest:
+    """A request waiting to be handled as part of a batch."""
+
+    __slots__ = ('request', 'response', 'error', 'event', 'queued_at')
+
+    def __init__(self, request: Any):
+        """Initializes the pending request.
+
+        Args:
+            request (`Any`): The request data.
+        """
+
+        self.request = request
+        self.response = None
+        self.error: Optional[Exception] = None
+        self.event = threading.Event()
+        self.queued_at = time.monotonic()
+
+    def get_response(self) -> Any:
+        """Wait for and get the response to the request.
+
+        Returns:
+            `Any`: The response.
+
+        Raises:
+            `Exception`: The error raised while handling the batch, if
+                any.
+        """
+
+        self.event.wait()
+
+        if self.error is not None:
+            raise self.error
+
+        return self.response
+
+
+class _Batcher:
+    """Collects concurrent requests and handles them in batches.
+
+    Note:
+        Batches are handled by one of the waiting callers at a time;
+        the processor waits for a batch to fill until the oldest queued
+        request has waited `max_wait` seconds, handles batches until
+        its own request is done, then hands any remaining requests to
+        the next waiting caller.
+    """
+
+    def __init__(self, func: Callable, max_batch_size: int,
+                 max_wait: float):
+        """Initializes the batcher.
+
+        Args:
+            func (`Callable`): The method handling a list of requests.
+            max_batch_size (`int`): The largest batch to handle at once.
+            max_wait (`float`): The most seconds a request waits for its
+                batch to fill.
+        """
+
+        self._func = func
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: List[_PendingRequest] = []
+        self._condition = threading.Condition()
+        self._processing = False
+
+    def submit(self, endpoint: Any, request: Any) -> Any:
+        """Submit a request and wait for its response.
+
+        Args:
+            endpoint (`Any`): The endpoint instance handling the request.
+            request (`Any`): The request data.
+
+        Returns:
+            `Any`: The response to the request.
+        """
+
+        pending = _PendingRequest(request)
+
+        with self._condition:
+            self._queue.append(pending)
+            self._condition.notify_all()
+
+            # Wait for the response, taking over as the processor if
+            # nobody else is handling the queue
+            while not pending.event.is_set() and self._processing:
+                self._condition.wait()
+
+            is_processor = not pending.event.is_set()
+
+            if is_processor:
+                self._processing = True
+
+        if is_processor:
+            try:
+                self._process(endpoint, pending)
+
+            finally:
+                with self._condition:
+                    self._processing = False
+                    self._condition.notify_all()
+
+        return pending.get_response()
+
+    def _process(self, endpoint: Any, own_pending: _PendingRequest):
+        """Handle queued batches until `own_pending` is done.
+
+        Args:
+            endpoint (`Any`): The endpoint instance to handle with.
+            own_pending (`_PendingRequest`): The processor's own request.
+        """
+
+        with self._condition:
+            # Give concurrent requests a chance to join the batch, timed
+            # from the oldest request so a processor taking over a
+            # queue does not wait again
+            deadline = self._queue[0].queued_at + self._max_wait
+
+            self._condition.wait_for(
+                lambda: len(self._queue) >= self._max_batch_size,
+                timeout=max(deadline - time.monotonic(), 0),
+            )
+
+        while not own_pending.event.is_set():
+            with self._condition:
+                batch = self._queue[:self._max_batch_size]
+                del self._queue[:self._max_batch_size]
+
+            self._handle_batch(endpoint, batch)
+
+            # Wake the callers whose responses are now ready
+            with self._condition:
+                self._condition.notify_all()
+
+    def _handle_batch(self, endpoint: Any, batch: List[_PendingRequest]):
+        """Handle a batch, passing each response to its request.
+
+        Args:
+            endpoint (`Any`): The endpoint instance to handle with.
+            batch (`List[_PendingRequest]`): The batch to handle.
+        """
+
+        try:
+            response_list = self._func(
+                endpoint,
+                [pending.request for pending in batch],
+            )
+
+            if len(response_list) != len(batch):
+                raise ValueError((
+                    f'{self._func.__name__} returned '
+                    f'{len(response_list)} responses for a batch of '
+                    f'{len(batch)} requests'
+                ))
+
+            for pending, response in zip(batch, response_list):
+                pending.response = response
+
+        except Exception as e:
+            for pending in batch:
+                pending.error = e
+
+        finally:
+            for pending in batch:
+                pending.event.set()
+
+
+def batchable(max_batch_size: int = 8, max_wait_ms: float = 5
+              ) -> Callable:
+    """Decorator for endpoint methods to handle concurrent requests in
+    batches.
+
+    Note:
+        The decorated method is called on one of the batched endpoint
+        instances, so it should not depend on per instance state.
+
+    Args:
+        max_batch_size (`int`, optional): The largest batch to handle at
+            once. Defaults to 8.
+        max_wait_ms (`float`, optional): The milliseconds to wait for
+            the first batch to fill. Defaults to 5.
+
+    Returns:
+        `Callable`: The decorator function.
+
+    Raises:
+        ValueError: If `max_batch_size` is less than 1 or `max_wait_ms`
+            is negative.
+    """
+
+    if max_batch_size < 1:
+        raise ValueError('max_batch_size must be at least 1')
+
+    if max_wait_ms < 0:
+        raise ValueError('max_wait_ms must not be negative')
+
+    def decorator(func: Callable) -> Callable:
+        batcher = _Batcher(func, max_batch_size, max_wait_ms / 1000)
+
+        @wraps(func)
+        def wrapper(self, request: Any) -> Any:
+            return batcher.submit(self, request)
+
+        return wrapper
+
+    return decorator
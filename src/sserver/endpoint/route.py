@@ -1,27 +1,28 @@
 """Handles URL routing."""
 
-from typing import Any
+from typing import Any, Dict, NamedTuple, Optional
 from sserver.endpoint.base_endpoint import BaseEndpoint
-from sserver.util import log, config, cache, module
+from sserver.util import log, config, module
 
 
-class Route:
-    """Wrapping class for a URL route."""
+# Loaded routes, keyed by url. The map is replaced rather than mutated on
+# reload, so concurrent lookups never see a partially loaded map
+_route_map: Dict[str, 'Route'] = {}
 
-    def __init__(self, url: str, name: str, endpoint: BaseEndpoint):
-        """Create a route instance with the given
-        `url`, `name`, and `endpoint`.
 
-        Args:
-            url (`str`): The url of the route.
-            name (`str`): The name of the route.
-            endpoint (`BaseEndpoint`): The endpoing
-                class to handle responses.
-        """
+class Route(NamedTuple):
+    """Wrapping class for a URL route.
 
-        self.url = url
-        self.name = name
-        self.endpoint = endpoint
+    Attributes:
+        url (`str`): The url of the route.
+        name (`str`): The name of the route.
+        endpoint (`BaseEndpoint`): The endpoing
+            class to handle responses.
+    """
+
+    url: str
+    name: str
+    endpoint: BaseEndpoint
 
     def __str__(self):
         return f'<{self.__class__.__name__} url="{self.url}">'
@@ -60,12 +61,26 @@ def route(url: str, name: str, endpoint: BaseEndpoint) -> Route:
     return Route(url, name, endpoint)
 
 
+def get_route(url: str) -> Optional[Route]:
+    """Get the loaded route with url `url`.
+
+    Args:
+        url (`str`): The url of the route.
+
+    Returns:
+        `Route` | `None`: The matching route or None if not found.
+    """
+
+    return _route_map.get(url)
+
+
 def clear():
     """Clear the loaded routes."""
 
+    global _route_map
+
     log.info('Clearing routes')
-    route_manifest = cache.pop('route_manifest', default=[])
-    cache.delete(*route_manifest)
+    _route_map = {}
 
 
 def load():
@@ -76,15 +91,15 @@ def load():
             bool.
     """
 
-    clear()
+    global _route_map
+
+    loaded_route_map = {}
 
     ROUTE_FILENAME = config.get('route_filename')
     ROUTE_LIST_VARIABLE = config.get('route_list_variable')
 
     route_module_list = module.load_from_filename(f'{ROUTE_FILENAME}.py')
 
-    route_manifest = []
-
     log.info('Loading Routes...', route_module_list)
     for route_module in route_module_list:
 
@@ -112,14 +127,18 @@ def load():
             [],
         )
         for route in route_list:
+            url = route.url
 
             # Ensure routes are prefixed by a slash
-            if route.url[0] != '/':
-                route.url = f'/{route.url}'
+            if url[0] != '/':
+                url = f'/{url}'
 
             # If prefix with app name is True, prefix the route url
             if prefix_route_with_app_name:
-                route.url = f'/{APP_NAME}{route.url}'
+                url = f'/{APP_NAME}{url}'
+
+            # Routes are immutable, so create the loaded route
+            route = Route(url, route.name, route.endpoint)
 
             info_message = (
                 f'Found Route "{route.url}", handled by ',
@@ -128,9 +147,8 @@ def load():
 
             log.info(''.join(info_message))
 
-            # Assign route and add to manifest
-            cache.set(route.url, route)
-
-            route_manifest.append(route.url)
+            # Index the route by its url
+            loaded_route_map[route.url] = route
 
-    cache.set('route_manifest', route_manifest)
+    # Publish the loaded routes in one assignment
+    _route_map = loaded_route_map
@@ -17,13 +17,17 @@ from sserver.parse.base_literal import Context
 
 
 def load():
-    """Registers builtin literal classes."""
+    """Registers builtin literal classes and clears parsed expressions."""
 
     # @future Load literal classes from apps / project
 
     # Ensure built in literal classes are registered
     from sserver.parse import literal  # noqa: F401
 
+    # Cleared after registering, so nothing parsed before the literals
+    # were available survives
+    parse_string_to_expression.cache_clear()
+
 
 __all__ = [
     'Identifier',
@@ -33,5 +37,4 @@ __all__ = [
     'parse_string_to_value',
     'Context',
     'ExpressionItem',
-    'Context',
 ]
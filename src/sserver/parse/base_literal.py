@@ -149,6 +149,8 @@ def add_constant_operator(operator_name: str, value: Any):
         'function': lambda: value,
     }
 
+    _clear_parsed_expressions()
+
 
 # Add constant operators to the operator map
 def try_add_constant_operator(operator_name: str, value: Any
@@ -339,6 +341,19 @@ def _register_literal_class(literal_class: Type,
         'literal_class': literal_class,
     }
 
+    _clear_parsed_expressions()
+
+
+def _clear_parsed_expressions():
+    """Clears the cached parsed expressions, as they may no longer
+        match the registered literals and operators.
+    """
+
+    # Imported here as the parse module imports this one
+    from sserver.parse.parse import parse_string_to_expression
+
+    parse_string_to_expression.cache_clear()
+
 
 # Decorator for literal classes to register them
 def register_literal_class(start_char: Union[str, Tuple[str]],
@@ -426,6 +441,9 @@ def register_literal_class(start_char: Union[str, Tuple[str]],
 class Evaluatable:
     """Represents an evaluatable object."""
 
+    # Empty slots allow subclasses to opt out of an instance dict
+    __slots__ = ()
+
     def evaluate(self, context: Context) -> Any:
         """Evaluates the object.
 
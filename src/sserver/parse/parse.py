@@ -1,6 +1,8 @@
 """Parse values into Python objects."""
 
 
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Optional, Union
 from sserver.parse.base_literal import (
     Evaluatable,
@@ -71,7 +73,7 @@ class Identifier(Evaluatable):
     def evaluate(self, context: Context
                  ) -> Optional[Union[Any, callable]]:
         """Evaluates the identifier. Returns None if no value found
-            in context.
+            in context, or if the context is not a mapping.
 
         Args:
             context (`Context`): The context variables.
@@ -81,21 +83,32 @@ class Identifier(Evaluatable):
                 keywords function.
         """
 
-        value = None
+        # Attribute identifiers evaluate against their parent value,
+        # which need not be a mapping
+        if not isinstance(context, Mapping):
+            return None
 
-        if self._value in context:
-            if hasattr(context, '__getitem__'):
-                value = context[self._value]
+        # Look the value up once rather than checking membership first
+        try:
+            value = context[self._value]
 
-                if self._child_identifier is not None:
-                    value = self._child_identifier.evaluate(value)
+        except KeyError:
+            return None
+
+        if self._child_identifier is not None:
+            value = self._child_identifier.evaluate(value)
 
         return value
 
 
+@lru_cache(maxsize=1024)
 def parse_string_to_expression(args: str):
     """Parse the passed `args` string into a list of Python objects.
 
+    Note:
+        Parsed expressions are cached by `args` and shared between
+            callers, so must not be modified.
+
     Args:
         args (`str`): The arguments to parse.
 
@@ -1,6 +1,7 @@
 """Definitions for a parse tree."""
 
 
+from operator import itemgetter
 from typing import Any, List, Optional, Union
 from sserver.parse import exception
 from sserver.parse.base_literal import (
@@ -17,6 +18,8 @@ ExpressionItem = Union[Operator, Evaluatable]
 class Expression(Evaluatable):
     """Represents an expression."""
 
+    __slots__ = ('_items',)
+
     def __init__(self, items: List[ExpressionItem]):
         self._items: List[ExpressionItem] = items
 
@@ -69,6 +72,8 @@ class Expression(Evaluatable):
 class ParseTree:
     """Represents a parse tree following operator precedence."""
 
+    __slots__ = ('expression', '_reconstructed_expression')
+
     def __init__(self, expression: Expression):
         # Ensure the given expression is an expression object
         if not isinstance(expression, Expression):
@@ -79,6 +84,9 @@ class ParseTree:
 
         self.expression = expression
 
+        # Only built when an error message requires it
+        self._reconstructed_expression: Optional[str] = None
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
         return f'<{class_name}, expression: {self.expression}>'
@@ -86,16 +94,20 @@ class ParseTree:
     def _get_reconstructed_expression(self) -> str:
         """Gets the reconstructed expression.
 
+        Note:
+            The reconstructed expression is only used in error messages,
+                so it is built on first use and reused afterwards.
+
         Returns:
             `str`: The reconstructed expression.
         """
 
-        return ' '.join(
-            map(
-                lambda item: str(item),
-                self.expression
+        if self._reconstructed_expression is None:
+            self._reconstructed_expression = ' '.join(
+                map(str, self.expression)
             )
-        )
+
+        return self._reconstructed_expression
 
     def evaluate(self, context: Context) -> Optional[Any]:
         """Evaluates the parse tree to a value.
@@ -112,38 +124,42 @@ class ParseTree:
                 used.
         """
 
-        # First evaluate all literals, identifiers and expressions
-        # in the expression
-        evaluated_items = list(
-            map(
-                lambda item: item.evaluate(context) if isinstance(
-                    item, Evaluatable
-                ) else item,
-                self.expression
-            )
-        )
-
-        # Next, create create a list of operatrs and their index
-        # in order of precedence (highest to lowest)
-        operator_matches = [
-            [index, operator]
-            for index, operator in enumerate(evaluated_items)
-            if isinstance(operator, Operator)
-        ]
+        # Bind frequently used globals to locals for the loops below
+        _isinstance = isinstance
+        _Evaluatable = Evaluatable
+        _Operator = Operator
+
+        evaluated_items = []
+        operator_matches = []
+
+        # In a single pass, evaluate all literals, identifiers and
+        # expressions in the expression, and collect each operator with
+        # its index, argument count and precedence. The argument count
+        # and precedence are read once here as they are not free to
+        # compute
+        for index, item in enumerate(self.expression._items):
+            if _isinstance(item, _Operator):
+                operator_matches.append([
+                    index,
+                    item,
+                    item.argument_count,
+                    item.precedence,
+                ])
+
+            elif _isinstance(item, _Evaluatable):
+                item = item.evaluate(context)
+
+            evaluated_items.append(item)
 
         # Sort operators by precedence (highest to lowest)
         operator_matches.sort(
-            key=lambda operator: operator[1].precedence,
+            key=itemgetter(3),
             reverse=True
         )
 
         # Using the sorted operators, calculate the expression value
-        for index, operator in operator_matches:
-            # First get the number of expected arguments for the
-            # operator
-            # @note expected_args of 1 always defaults to a right arg
-            expected_args = operator.argument_count
-
+        # @note expected_args of 1 always defaults to a right arg
+        for index, operator, expected_args, _ in operator_matches:
             # Check variables
             has_left_operand = False
             has_right_operand = False
@@ -11,24 +11,35 @@ from typing import Optional
 
 
 def get_path_to_parent(parent_folder: str) -> Optional[str]:
-    """Get the path to the cloests directory with name `parent_folder`.
+    """Get the path to the closest ancestor directory with name
+    `parent_folder`, starting from the current working directory.
 
     Args:
         parent_folder (`str`): The name of the parent directory to find.
 
     Note:
-        This will only return the first folder with name `parent_folder`.
+        Only the ancestors of the current working directory are checked,
+        so the search is bounded by the depth of the path rather than
+        the size of the directory tree.
 
     Returns:
         `str` | `None`: The path to the closest directory with name
             `parent_folder` or None if not found.
     """
 
-    for root, dirs, files in os.walk(os.getcwd()):
-        if parent_folder in dirs:
-            return os.path.join(root, parent_folder)
+    current_path = os.getcwd()
 
-    return None
+    while True:
+        if os.path.basename(current_path) == parent_folder:
+            return current_path
+
+        parent_path = os.path.dirname(current_path)
+
+        # The filesystem root is its own parent
+        if parent_path == current_path:
+            return None
+
+        current_path = parent_path
 
 
 def get_directory_list(directory: str) -> List[str]:
@@ -4,7 +4,9 @@
 import mimetypes
 import os
 import sys
+from functools import lru_cache
 from typing import Optional
+from typing import Tuple
 from typing import Union
 from sserver.path import path
 from sserver.util import cache
@@ -13,9 +15,30 @@ from sserver.util import log
 # from shutil import copy
 
 
+# The path prefix of each app static folder, so other paths are rejected
+# without a lookup
+_static_prefix_tuple: Tuple[str, ...] = ()
+
+
 def load():
     """Load static files ready for the server."""
 
+    _load_static_path_map()
+
+    # Drop lookups made against the previous static files
+    _lookup_static_file_path.cache_clear()
+
+
+def _load_static_path_map():
+    """Find the static files in each app and cache their paths.
+
+    Note:
+        Cached lookups are left untouched, so this can be called from
+            `_lookup_static_file_path` without clearing its own cache.
+    """
+
+    global _static_prefix_tuple
+
     log.info('Loading static files...')
 
     # Get each app and locate static path (if exists)
@@ -24,11 +47,15 @@ def load():
     APP_DIRECTORY_PATH = os.path.join(sys.path[0], APP_FOLDER)
     APP_DIRECTORY_LIST = path.get_directory_list(APP_DIRECTORY_PATH)
 
+    # Every static file path starts with the app folder
+    APP_FOLDER_LENGTH = len(APP_FOLDER)
+
     # Ensure STATIC_FOLDER directory exists
     if not os.path.isdir(STATIC_FOLDER):
         os.mkdir(STATIC_FOLDER)
 
     static_path_map = {}
+    static_prefix_list = []
 
     for APP in APP_DIRECTORY_LIST:
 
@@ -45,6 +72,10 @@ def load():
 
             STATIC_PATH = os.path.join(STATIC_FOLDER, PATH_TO_CLONE)
 
+            static_prefix_list.append(
+                os.path.join(PATH_TO_CLONE[APP_FOLDER_LENGTH:], '')
+            )
+
             # Ensure static folder for app exists
             if not os.path.isdir(STATIC_PATH):
                 os.makedirs(STATIC_PATH)
@@ -54,14 +85,15 @@ def load():
             for ROOT, _, FILE_LIST in os.walk(PATH_TO_CLONE):
                 for FILE in FILE_LIST:
                     FILE_PATH = os.path.join(ROOT, FILE)
-                    RELATIVE_PATH = os.path.relpath(
-                        FILE_PATH,
-                        PATH_TO_CLONE,
-                    )
 
                     # @future Config value for copying static files
                     # @future to different directory
                     # @future Allow handling custom static files, e.g. .scss
+                    # RELATIVE_PATH = os.path.relpath(
+                    #     FILE_PATH,
+                    #     PATH_TO_CLONE,
+                    # )
+
                     # # Ensure file directory exists in static folder
                     # STATIC_FILE_DESTINATION = os.path.join(
                     #     STATIC_PATH,
@@ -81,11 +113,9 @@ def load():
                     #     STATIC_FILE_DESTINATION,
                     # )
 
-                    # Add to static path map
-                    static_file_key = os.path.join(
-                        PATH_TO_CLONE,
-                        RELATIVE_PATH,
-                    ).replace(APP_FOLDER, '')
+                    # Add to static path map, keyed by the file path
+                    # without the app folder prefix
+                    static_file_key = FILE_PATH[APP_FOLDER_LENGTH:]
 
                     static_path_map[static_file_key] = FILE_PATH
 
@@ -93,19 +123,52 @@ def load():
 
     cache.set('__static__', static_path_map)
 
+    _static_prefix_tuple = tuple(static_prefix_list)
 
-def get_static_file_path(path: str) -> str:
+
+def get_static_file_path(path: str) -> Optional[str]:
     """Get a static file path.
 
+    Note:
+        The query string is ignored, and paths outside every app static
+            folder are rejected without a lookup.
+
     Args:
         path (`str`): The path to get.
+
+    Returns:
+        `str` | `None`: The static file path, or None if not found.
+    """
+
+    path = path.split('?', 1)[0]
+
+    if not path.startswith(_static_prefix_tuple):
+        return None
+
+    return _lookup_static_file_path(path)
+
+
+@lru_cache(maxsize=4096)
+def _lookup_static_file_path(path: str) -> Optional[str]:
+    """Look up a static file path, reloading static files on a miss.
+
+    Note:
+        Lookups are cached per path until static files are next loaded,
+        so a path that is not a static file only triggers a reload the
+        first time it is requested.
+
+    Args:
+        path (`str`): The path, without a query string, to look up.
+
+    Returns:
+        `str` | `None`: The static file path, or None if not found.
     """
 
     static_path = cache.get('__static__').get(path)
 
     # If no static file was found, reload files in an attempt to find it
     if static_path is None:
-        load()
+        _load_static_path_map()
         static_path = cache.get('__static__').get(path)
 
     return static_path
@@ -1,29 +1,55 @@
 import json
+import threading
 from urllib.parse import parse_qs as parse_query_string
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from sserver import templating, parse
-from sserver.mixin.option_mixin import OptionMixin
 from sserver.endpoint import route
-from sserver.util import log, cache, config
+from sserver.util import log, config
 from sserver.path import static
 
 
-class BaseServer(OptionMixin):
+# Defaults for responses that do not set a status or headers. The
+# headers list itself is built per response as WSGI servers may modify it
+_DEFAULT_STATUS = '200 OK'
+_DEFAULT_HEADER = ('Content-Type', 'text/html')
 
-    def __init__(self, environment: Dict[str, str] = None,
-                 start_response: Callable = None):
+
+# Pre-encoded bodies for the stock error responses
+_BODY_404 = b'404 Not Found'
+_BODY_405 = b'405 Method Not Allowed'
+_BODY_500 = b'500 Internal Server Error'
+
+
+# Whether initialize has loaded the server, the number of load steps
+# completed so a failed load resumes where it stopped, and the lock
+# serializing the first load between concurrent requests
+_initialized = False
+_completed_load_count = 0
+_initialize_lock = threading.Lock()
+
+
+# Maps request methods onto the endpoint method handling them
+_METHOD_NAME_MAP = {
+    'GET': 'get',
+    'POST': 'post',
+    'PUT': 'put',
+    'DELETE': 'delete',
+}
+
+
+class BaseServer:
+
+    def __init__(self, environment: Dict[str, Any],
+                 start_response: Callable):
         """Initialize the server.
 
         Args:
-            environment (`Dict[str, str]`): The environment dict.
+            environment (`Dict[str, Any]`): The environment dict.
             start_response (`Callable`): The start_response function.
         """
 
-        if environment is not None and start_response is not None:
-            super().__init__({
-                'environment': environment,
-                'start_response': start_response,
-            })
+        self._environment = environment
+        self._start_response = start_response
 
     def __iter__(self):
         """Get a response from the server.
@@ -41,128 +67,123 @@ class BaseServer(OptionMixin):
             `bytes`: The response content.
         """
 
-        status, headers, content = None, None, None
+        environment = self._environment
 
+        # Report any unexplained error as a 500 response
         try:
+            response = self.get_response(environment)
+
+        except Exception as e:
+            log.exception(e)
 
-            response = self.get_response()
+            response = self.handle_500()
 
-            # Default headers and status to an OK HTML response
-            headers = response.get('headers',
-                                   [('Content-Type', 'text/html')])
+        # Default headers and status to an OK HTML response, only
+        # building the default headers list when it is needed
+        headers = response.get('headers')
 
-            # Get status and ensure it is bytes
-            status = response.get('status', '200 OK')
+        if headers is None:
+            headers = [_DEFAULT_HEADER]
 
-            # Get content and ensure it is bytes
-            content = response.get('body', '')
-            if not isinstance(content, bytes):
-                content = str(content).encode('utf-8')
+        status = response.get('status', _DEFAULT_STATUS)
 
-        except Exception as e:
-            log.exception(e, reraise=False)
+        # Get content and ensure it is bytes, only converting to a
+        # string first if it is not one already
+        content = response.get('body', b'')
+        if isinstance(content, str):
+            content = content.encode('utf-8')
 
-            # Ensure a response for unexplained errors
-            headers = [('Content-Type', 'text/html')]
-            status = '500 Internal Server Error'
-            content = b'500 Internal Server Error'
+        elif not isinstance(content, bytes):
+            content = str(content).encode('utf-8')
 
-        start_response = self.getOption('start_response')
-        start_response(status, headers)
+        self._start_response(status, headers)
 
         return content
 
-    def get_response(self) -> Dict[str, str]:
+    def get_response(self, environment: Dict[str, Any]) -> Dict[str, str]:
         """Get the requests response.
 
+        Note:
+            Errors are not caught here, `handle_request` reports them
+                as a 500 response.
+
+        Args:
+            environment (`Dict[str, Any]`): The environment dict.
+
         Returns:
             `Dict[str, str]`: The response dict.
         """
 
-        # Wrap entire request handle in try/except to report 500 errors
-        try:
-
-            # Check if request is for a static file
-            if self.is_static_file():
-                return self.handle_static_file()
+        uri = environment.get('REQUEST_URI')
 
-            matched_route = self.get_route()
+        # Check if request is for a static file
+        if self.is_static_file(uri):
+            return self.handle_static_file(uri)
 
-            if matched_route is None:
-                return self.handle_404()
+        matched_route = self.get_route(environment.get('PATH_INFO'))
 
-            else:
-                return self.handle_route(matched_route)
+        if matched_route is None:
+            return self.handle_404()
 
-        except Exception as e:
+        return self.handle_route(matched_route, environment)
 
-            log.exception(e)
-
-            return self.handle_500()
-
-    def is_static_file(self) -> bool:
+    def is_static_file(self, uri: str) -> bool:
         """Check if the request is for a static file.
 
+        Args:
+            uri (`str`): The REQUEST_URI of the request.
+
         Returns:
             `bool`: True if static file, False otherwise.
         """
 
-        environment = self.getOption('environment')
-
-        uri = environment.get('REQUEST_URI')
-
         return static.is_static_file(uri)
 
-    def handle_static_file(self) -> Dict[str, str]:
+    def handle_static_file(self, uri: str) -> Dict[str, str]:
         """Handle a static file request.
 
+        Args:
+            uri (`str`): The REQUEST_URI of the request.
+
         Returns:
             `Dict[str, str]`: The static file response.
         """
 
-        environment = self.getOption('environment')
-
-        uri = environment.get('REQUEST_URI')
-
         return static.get_static_file(uri)
 
-    def get_route(self) -> Optional[route.Route]:
-        """Get the matching route, if any, using the REQUEST_URI.
+    def get_route(self, path: str) -> Optional[route.Route]:
+        """Get the matching route, if any, using the PATH_INFO.
+
+        Args:
+            path (`str`): The PATH_INFO of the request.
 
         Returns:
             `Route` | `None`: The matching route or None if not found.
         """
 
-        environment = self.getOption('environment')
-
-        uri = environment.get('PATH_INFO')
-
-        matched_route = cache.get(uri)
+        return route.get_route(path)
 
-        return matched_route
-
-    def handle_route(self, matched_route: route.Route) -> Dict[str, str]:
+    def handle_route(self, matched_route: route.Route,
+                     environment: Dict[str, Any]) -> Dict[str, str]:
         """Handle the request using the matched `matched_route`.
 
         Args:
             matched_route (`Route`): The matched route.
+            environment (`Dict[str, Any]`): The environment dict.
 
         Returns:
             `Dict[str, str]`: The routes response.
         """
 
-        environment = self.getOption('environment')
         method = environment.get('REQUEST_METHOD')
-        content = None
 
-        endpoint = matched_route.endpoint()
+        # Resolve the endpoint method handling the request method
+        method_name = _METHOD_NAME_MAP.get(method)
 
-        method_map = {
-            'GET': endpoint.get,
-            'POST': endpoint.post,
-            'PUT': endpoint.put,
-            'DELETE': endpoint.delete,
-        }
+        if method_name is None:
+            return self.handle_405()
+
+        endpoint = matched_route.endpoint()
 
         # Read request body
         request_body = {}
@@ -171,21 +192,18 @@ class BaseServer(OptionMixin):
             request_body = parse_query_string(environment.get('QUERY_STRING'))
 
         else:
-            environment = self.getOption('environment')
             content_length = environment.get('CONTENT_LENGTH')
             if content_length is not None:
-                # Read request body, decode from bytes and parse to json
-                request_body = json.loads(
-                    environment['wsgi.input'].read(
-                        int(content_length)
-                    ).decode('utf-8')
+                # Read request body and parse to json, json.loads
+                # decodes the bytes itself
+                raw_request_body = environment['wsgi.input'].read(
+                    int(content_length)
                 )
 
-        if method in method_map:
-            content = method_map[method](request_body)
+                if raw_request_body:
+                    request_body = json.loads(raw_request_body)
 
-        else:
-            return self.handle_405()
+        content = getattr(endpoint, method_name)(request_body)
 
         return {
             'body': content,
@@ -199,7 +217,7 @@ class BaseServer(OptionMixin):
         """
 
         return {
-            'body': '404 Not Found',
+            'body': _BODY_404,
             'status': '404 Not Found',
         }
 
@@ -211,7 +229,7 @@ class BaseServer(OptionMixin):
         """
 
         return {
-            'body': '405 Method Not Allowed',
+            'body': _BODY_405,
             'status': '405 Method Not Allowed',
         }
 
@@ -223,26 +241,49 @@ class BaseServer(OptionMixin):
         """
 
         return {
-            'body': '500 Internal Server Error',
+            'body': _BODY_500,
             'status': '500 Internal Server Error',
         }
 
 
-def application(environment, start_response) -> List[bytes]:
+def initialize():
+    """Load the config, routes, static files, literals and template tags.
+
+    Note:
+        Only the first successful call loads anything. Concurrent first
+        calls wait for a single load, so this is safe to call on every
+        request. If a step fails, the next call retries from that step.
+    """
+
+    global _initialized, _completed_load_count
+
+    if _initialized:
+        return
+
+    with _initialize_lock:
+        # Another thread may have loaded while this one waited
+        if _initialized:
+            return
+
+        log.info('Loading config, route and static...')
+
+        load_module_list = (config, route, static, parse, templating)
+
+        # Skip the steps a failed earlier call completed, as loading the
+        # config again would fail on the initialized cache
+        for load_module in load_module_list[_completed_load_count:]:
+            load_module.load()
+            _completed_load_count += 1
+
+        _initialized = True
 
-    server = BaseServer()
 
-    server.setOptions({
-        'environment': environment,
-        'start_response': start_response
-    })
+def application(environment, start_response) -> Tuple[bytes]:
 
-    return [server.handle_request()]
+    initialize()
 
+    server = BaseServer(environment, start_response)
 
-log.info('Loading config, route and static...')
-config.load()
-route.load()
-static.load()
-parse.load()
-templating.load()
+    # A single item tuple keeps the response sized, letting WSGI servers
+    # set the Content-Length header
+    return (server.handle_request(),)
@@ -2,7 +2,9 @@
 
 
 from typing import Any, Dict, Optional
+from sserver.templating import template
 from sserver.templating.template import Template
+from sserver.templating import template_renderer
 from sserver.templating.template_renderer import (
     TemplateRenderer,
     BlockTagContents,
@@ -73,7 +75,10 @@ def render_to_string(template_name: str, context: Dict[Any, Any],
 
 
 def load():
-    """Registers builtin template tags."""
+    """Registers builtin template tags and clears cached templates."""
+
+    template.clear()
+    template_renderer.clear()
 
     # @future Load template tags from apps / project
 
@@ -1,14 +1,50 @@
 """Handles tag registration and lookup."""
 
 
-import copy
-from typing import Dict, List, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Set, Union
 from sserver.templating import exception
 
 
+class InlineTag(NamedTuple):
+    """A registered inline tag.
+
+    Attributes:
+        tag_function (`callable`): The function called when the tag is
+            encountered.
+    """
+
+    tag_function: callable
+
+
+class BlockTag(NamedTuple):
+    """A registered block tag.
+
+    Attributes:
+        end_tag (`str`): The end tag for the block tag.
+        tag_function (`callable`): The function called when the tag is
+            encountered.
+        sub_tags (`Mapping[str, callable]`): The function called for
+            each sub tag, keyed by sub tag name.
+    """
+
+    end_tag: str
+    tag_function: callable
+    sub_tags: Mapping[str, callable]
+
+
 # Inline and block tags
-_inline_tag_map = {}
-_block_tag_map = {}
+_inline_tag_map: Dict[str, InlineTag] = {}
+_block_tag_map: Dict[str, BlockTag] = {}
+
+
+# Inline and block tags together, for dispatching with one lookup
+_tag_map: Dict[str, Union[InlineTag, BlockTag]] = {}
+
+
+# Names of every registered tag and sub tag
+_registered_tag_name_set: Set[str] = set()
 
 
 # Alias for tag match
@@ -41,14 +77,28 @@ def tag_is_block(tag_name: str) -> bool:
     return tag_name in _block_tag_map
 
 
-def get_block_tag_match(tag_name: str) -> TagMatch:
+def get_tag(tag_name: str) -> Union[InlineTag, BlockTag, None]:
+    """Gets a registered tag in a single lookup.
+
+    Args:
+        tag_name (`str`): The name of the tag.
+
+    Returns:
+        `InlineTag` | `BlockTag` | `None`: The registered tag, or None if
+            not found.
+    """
+
+    return _tag_map.get(tag_name)
+
+
+def get_block_tag_match(tag_name: str) -> BlockTag:
     """Gets a matched block tag.
 
     Args:
         tag_name (`str`): The name of the tag.
 
     Returns:
-        `TagMatch`: The data for the block tag.
+        `BlockTag`: The data for the block tag.
     """
 
     if tag_name not in _block_tag_map:
@@ -56,7 +106,7 @@ def get_block_tag_match(tag_name: str) -> TagMatch:
             f'Unknown block tag {tag_name}'
         )
 
-    return copy.deepcopy(_block_tag_map[tag_name])
+    return _block_tag_map[tag_name]
 
 
 def get_tag_function(tag_name: str, is_block: bool = False,
@@ -82,26 +132,20 @@ def get_tag_function(tag_name: str, is_block: bool = False,
         else _inline_tag_map
     )
 
-    if tag_name not in tag_data:
+    tag = tag_data.get(tag_name)
+
+    if tag is None:
         raise exception.UnknownTagException(f'Unknown tag {tag_name}')
 
-    tag_function = tag_data[tag_name].get('tag_function')
+    tag_function = tag.tag_function
 
     if sub_tag is not None:
-        sub_tag_data = tag_data[tag_name].get('sub_tags', [])
-
-        if sub_tag not in sub_tag_data:
+        if not is_block or sub_tag not in tag.sub_tags:
             raise exception.UnknownTagException(
                 f'Unknown sub tag {sub_tag} for tag {tag_name}'
             )
 
-        if isinstance(sub_tag_data, dict):
-            sub_tag_function = tag_data[tag_name]['sub_tags'][sub_tag].get(
-                'tag_function'
-            )
-
-            if sub_tag_function is not None:
-                tag_function = sub_tag_function
+        tag_function = tag.sub_tags[sub_tag]
 
     if tag_function is None:
         raise exception.MissingTagFunctionException(
@@ -121,21 +165,7 @@ def _tag_already_registered(tag_name: str) -> bool:
         `bool`: True if the tag is already registered, False otherwise.
     """
 
-    tag_registered = (
-        tag_name in _inline_tag_map or
-        tag_name in _block_tag_map
-    )
-
-    # If tag is not registered as a main tag, check all sub tags
-    if not tag_registered:
-        for block_tag_match in _block_tag_map.values():
-            sub_tags = block_tag_match.get('sub_tags', [])
-
-            if tag_name in sub_tags:
-                tag_registered = True
-                break
-
-    return tag_registered
+    return tag_name in _registered_tag_name_set
 
 
 def _register_block_tag(tag_name: str, end_tag: str,
@@ -162,18 +192,37 @@ def _register_block_tag(tag_name: str, end_tag: str,
 
     if sub_tag_list is not None:
         for sub_tag in sub_tag_list:
-            if _tag_already_registered(tag_name):
+            if _tag_already_registered(sub_tag):
                 raise exception.TagAlreadyRegisteredException(
                     f'Sub tag {sub_tag} is already registered'
                 )
 
-    _block_tag_map[tag_name] = {
-        'end_tag': end_tag,
-        'tag_function': tag_function,
-    }
+    # Names are interned to match the names deconstructed from templates
+    tag_name = sys.intern(tag_name)
+    end_tag = sys.intern(end_tag)
 
-    if sub_tag_list is not None:
-        _block_tag_map[tag_name]['sub_tags'] = sub_tag_list
+    # Resolve each sub tag function, defaulting to the block tag function
+    sub_tag_map = {}
+
+    if isinstance(sub_tag_list, dict):
+        for sub_tag, sub_tag_match in sub_tag_list.items():
+            sub_tag_map[sys.intern(sub_tag)] = (
+                sub_tag_match.get('tag_function') or tag_function
+            )
+
+    elif sub_tag_list is not None:
+        for sub_tag in sub_tag_list:
+            sub_tag_map[sys.intern(sub_tag)] = tag_function
+
+    # Registered tags are shared without copying, so keep them read only
+    _block_tag_map[tag_name] = BlockTag(
+        end_tag,
+        tag_function,
+        MappingProxyType(sub_tag_map),
+    )
+    _tag_map[tag_name] = _block_tag_map[tag_name]
+    _registered_tag_name_set.add(tag_name)
+    _registered_tag_name_set.update(sub_tag_map)
 
 
 def _register_inline_tag(tag_name: str, tag_function: callable):
@@ -190,9 +239,11 @@ def _register_inline_tag(tag_name: str, tag_function: callable):
             f'Tag {tag_name} is already registered'
         )
 
-    _inline_tag_map[tag_name] = {
-        'tag_function': tag_function
-    }
+    tag_name = sys.intern(tag_name)
+
+    _inline_tag_map[tag_name] = InlineTag(tag_function)
+    _tag_map[tag_name] = _inline_tag_map[tag_name]
+    _registered_tag_name_set.add(tag_name)
 
 
 def register_inline_tag(tag_name: str) -> callable:
@@ -1,11 +1,23 @@
 """Template class for reading and rendering."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from os import sep
 from os.path import join, exists, isfile, normpath
 from sserver.util import config
 
 
+# Contents of previously read template files, keyed by app name and
+# template name
+_template_str_cache: Dict[Tuple[str, str], str] = {}
+
+
+def clear():
+    """Clear the cached template file contents."""
+
+    _template_str_cache.clear()
+
+
 class Template:
     """The template class for loading and rendering templates."""
 
@@ -51,34 +63,78 @@ class Template:
             `Template`: This template object.
         """
 
-        # Separate the template_name into components (assuming path)
-        template_name = normpath(template_name)
-        template_name_components = template_name.split(sep)
-
-        # If app_name is not passed, extract it from the template_name
-        if app_name is None:
-            app_name = template_name_components[0]
-
-        # Reconstruct template name ignoring first component
-        template_name = join(*template_name_components[1:])
-
-        APP_FOLDER = config.get('app_folder')
-        TEMPLATE_FOLDER = config.get('template_folder', app_name=app_name)
-        TEMPLATE_PATH = join(
-            APP_FOLDER,
+        app_name, template_name = _resolve_template_name(
+            template_name,
             app_name,
-            TEMPLATE_FOLDER,
-            template_name
         )
 
-        template_str = None
+        template_str = _template_str_cache.get((app_name, template_name))
 
-        # Read template file
-        if exists(TEMPLATE_PATH):
-            if isfile(TEMPLATE_PATH):
-                with open(TEMPLATE_PATH) as f:
-                    template_str = f.read()
+        if template_str is None:
+            template_str = _read_template_file(template_name, app_name)
 
         self._template_str = template_str
 
         return self
+
+
+@lru_cache(maxsize=256)
+def _resolve_template_name(template_name: str, app_name: Optional[str]
+                           ) -> Tuple[str, str]:
+    """Resolves the app name and app relative name of a template.
+
+    Args:
+        template_name (`str`): The name of the template to load.
+        app_name (`str`, Optional): The name of the app to load the
+            template from. If not passed, app_name will be extracted
+            from template_name.
+
+    Returns:
+        `Tuple[str, str]`: The app name and template name.
+    """
+
+    # Separate the template_name into components (assuming path)
+    template_name = normpath(template_name)
+    template_name_components = template_name.split(sep)
+
+    # If app_name is not passed, extract it from the template_name
+    if app_name is None:
+        app_name = template_name_components[0]
+
+    # Reconstruct template name ignoring first component
+    template_name = join(*template_name_components[1:])
+
+    return app_name, template_name
+
+
+def _read_template_file(template_name: str, app_name: str
+                        ) -> Optional[str]:
+    """Reads a template file, caching its contents if found.
+
+    Args:
+        template_name (`str`): The name of the template, relative to
+            the apps template folder.
+        app_name (`str`): The name of the app to read the template from.
+
+    Returns:
+        `str` | `None`: The template string, or None if not found.
+    """
+
+    APP_FOLDER = config.get('app_folder')
+    TEMPLATE_FOLDER = config.get('template_folder', app_name=app_name)
+    TEMPLATE_PATH = join(
+        APP_FOLDER,
+        app_name,
+        TEMPLATE_FOLDER,
+        template_name
+    )
+
+    if not exists(TEMPLATE_PATH) or not isfile(TEMPLATE_PATH):
+        return None
+
+    with open(TEMPLATE_PATH) as f:
+        template_str = f.read()
+
+    _template_str_cache[(app_name, template_name)] = template_str
+
+    return template_str
@@ -1,21 +1,32 @@
 """Template renderer."""
 
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from sserver.templating import (
     Template,
     exception,
 )
 from sserver.templating.register import (
-    tag_is_inline,
-    tag_is_block,
+    InlineTag,
+    BlockTag,
+    get_tag,
     get_block_tag_match,
     get_tag_function,
 )
 
 
-_COMMENT_TAG_SYNTAX = '{#(.|\n)+#}'
-_LOGIC_TAG_SYNTAX = '{%(.+)%}'
+# Matches comments, which may span lines, and logic tags in one pass.
+# Compiled once at import; the pattern is non greedy so several tags or
+# comments can share a line
+_TAG_SYNTAX = re.compile(
+    r'(?P<comment>(?s:{#.+?#}))|{%\s*(?P<body>.+?)\s*%}'
+)
+
+# Matches comments alone, to drop them from block contents before the
+# surrounding whitespace is stripped
+_COMMENT_SYNTAX = re.compile(r'{#.+?#}', re.DOTALL)
 
 
 def _deconstruct_tag(tag_match: re.Match) -> Tuple[str, str]:
@@ -26,14 +37,20 @@ def _deconstruct_tag(tag_match: re.Match) -> Tuple[str, str]:
 
     Returns:
         `Tuple[str, str]`: The tag name and arguments.
+
+    Raises:
+        `UnknownTagException`: If the tag has no name.
     """
 
-    # Cleanup the syntax contents and separate items
-    syntax_contents = tag_match.group(1).strip().split(' ')
+    # Separate the function name from the args
+    syntax_contents = tag_match.group('body').split(None, 1)
 
-    # Get the function name and args
-    func_name = syntax_contents[0]
-    args = ' '.join(syntax_contents[1:])
+    if len(syntax_contents) == 0:
+        raise exception.UnknownTagException('Empty tag')
+
+    # Interned so registry lookups can compare names by identity
+    func_name = sys.intern(syntax_contents[0])
+    args = syntax_contents[1] if len(syntax_contents) > 1 else ''
 
     return func_name, args
 
@@ -41,21 +58,36 @@ def _deconstruct_tag(tag_match: re.Match) -> Tuple[str, str]:
 class _TagLogicBlock:
     """A logical block in a template."""
 
-    def __init__(self, block_start_match: re.Match):
+    __slots__ = (
+        '_block_start_match',
+        '_block_close_match',
+        '_sub_tag_matche_list',
+        '_block_close_tag_depth',
+        '_section_list',
+        '_tag',
+        '_block_tag_match',
+    )
+
+    def __init__(self, block_start_match: re.Match, tag_name: str,
+                 tag_args: str):
         """Initializes a new RenderBlock.
 
         Args:
             block_start_match (`re.Match`): The match object for the
                 block start tag.
+            tag_name (`str`): The name of the block start tag.
+            tag_args (`str`): The arguments of the block start tag.
         """
 
-        self._block_start_match = block_start_match
+        # Matches are kept with their deconstructed name and arguments
+        self._block_start_match = (block_start_match, tag_name, tag_args)
         self._block_close_match = None
         self._sub_tag_matche_list = []
         self._block_close_tag_depth = 0
-        self._current_sub_tag_index = -1
+        self._section_list = []
 
-        self._tag, _ = _deconstruct_tag(block_start_match)
+        self._tag = tag_name
+        self._block_tag_match = get_block_tag_match(self._tag)
 
     @property
     def tag(self) -> str:
@@ -67,11 +99,14 @@ class _TagLogicBlock:
 
         return self._tag
 
-    def try_add_sub_tag(self, tag_match: re.Match) -> bool:
+    def try_add_sub_tag(self, tag_match: re.Match, tag_name: str,
+                        tag_args: str) -> bool:
         """Tries to add a sub tag to this block.
 
         Args:
             tag_match (`re.Match`): The matched tag.
+            tag_name (`str`): The name of the matched tag.
+            tag_args (`str`): The arguments of the matched tag.
 
         Returns:
             `bool`: True if the tag was added, False otherwise.
@@ -80,33 +115,31 @@ class _TagLogicBlock:
         if self._block_close_tag_depth > 0:
             return False
 
-        tag_name, _ = _deconstruct_tag(tag_match)
-
-        this_block_tag_match = get_block_tag_match(self._tag)
-        sub_tags = this_block_tag_match.get('sub_tags', {})
+        sub_tags = self._block_tag_match.sub_tags
 
         if tag_name in sub_tags:
-            self._sub_tag_matche_list.append(tag_match)
+            self._sub_tag_matche_list.append(
+                (tag_match, tag_name, tag_args)
+            )
             return True
 
         return False
 
-    def check_closing_tag(self, tag_match: re.Match) -> bool:
+    def check_closing_tag(self, tag_match: re.Match, tag_name: str
+                          ) -> bool:
         """Checks if the given tag match is the closing tag for this
             block.
 
         Args:
             tag_match (`re.Match`): The matched tag.
+            tag_name (`str`): The name of the matched tag.
 
         Returns:
             `bool`: True if the tag_match is the closing tag for this
                 block, False otherwise.
         """
 
-        tag_name, _ = _deconstruct_tag(tag_match)
-
-        this_block_tag_match = get_block_tag_match(self._tag)
-        end_tag = this_block_tag_match['end_tag']
+        end_tag = self._block_tag_match.end_tag
 
         if tag_name == end_tag:
             if self._block_close_tag_depth > 0:
@@ -116,81 +149,96 @@ class _TagLogicBlock:
             self._block_close_match = tag_match
             return True
 
-        elif tag_is_block(tag_name):
-            # Check if the enclosed tag has a matching end tag
-            other_tag_match = get_block_tag_match(tag_name)
-            other_tag_end_tag = other_tag_match['end_tag']
+        else:
+            # Check if the enclosed tag is a block with a matching end
+            # tag
+            other_tag_match = get_tag(tag_name)
 
-            if other_tag_end_tag == end_tag:
+            if (isinstance(other_tag_match, BlockTag) and
+                    other_tag_match.end_tag == end_tag):
                 self._block_close_tag_depth += 1
 
         return False
 
-    def render(self, template_str: str, context: Dict[str, Any]
-               ) -> Tuple[str, int]:
-        """Renders the block.
+    def compile(self, template_str: str) -> int:
+        """Compiles the block into the contents and tag function of the
+            start tag and each sub tag.
+
+        Args:
+            template_str (`str`): The template string containing the
+                block.
 
         Returns:
-            `Tuple[str, int]`: The rendered block and the end index of
-                the block.
+            `int`: The end index of the block.
         """
 
-        USING_SUB_TAG = self._current_sub_tag_index > -1
+        tag_list = [self._block_start_match, *self._sub_tag_matche_list]
+        end_tag_start, end_tag_end = self._block_close_match.span()
 
-        NEXT_SUB_TAG_INDEX = self._current_sub_tag_index + 1
-        SUB_TAG_LEN = len(self._sub_tag_matche_list)
+        for index, (tag_match, tag_name, tag_args) in enumerate(tag_list):
+            USING_SUB_TAG = index > 0
 
-        CURRENT_RENDER_MATCH = self._sub_tag_matche_list[
-                self._current_sub_tag_index
-            ] if USING_SUB_TAG else self._block_start_match
+            # The contents run until the next sub tag or the end tag
+            _, start_tag_end = tag_match.span()
+            contents_end = end_tag_start
 
-        # Get the contents of the block using the start and end
-        # matches
-        _, start_tag_end = CURRENT_RENDER_MATCH.span()
-        end_tag_start, end_tag_end = self._block_close_match.span()
+            if index + 1 < len(tag_list):
+                contents_end, _ = tag_list[index + 1][0].span()
 
-        if SUB_TAG_LEN > 0 and SUB_TAG_LEN > NEXT_SUB_TAG_INDEX:
-            end_tag_start, _ = self._sub_tag_matche_list[
-                NEXT_SUB_TAG_INDEX
-            ].span()
+            block_contents = BlockTagContents(
+                _COMMENT_SYNTAX.sub(
+                    '',
+                    template_str[start_tag_end:contents_end],
+                ).strip()
+            )
 
-        block_contents = BlockTagContents(
-            template_str[
-                start_tag_end:end_tag_start
-            ].strip()
-        )
+            tag_function = get_tag_function(
+                self._tag,
+                is_block=True,
+                sub_tag=tag_name if USING_SUB_TAG else None
+            )
 
-        # Get and parse the block arguments
-        tag_name, args = _deconstruct_tag(CURRENT_RENDER_MATCH)
+            self._section_list.append(
+                (tag_function, block_contents, tag_args)
+            )
 
-        tag_function = get_tag_function(
-            self._tag,
-            is_block=True,
-            sub_tag=tag_name if USING_SUB_TAG else None
-        )
+        return end_tag_end
 
-        tag_output: Optional[str] = tag_function(
-            context, block_contents, args
-        )
+    def render(self, context: Dict[str, Any]) -> str:
+        """Renders the compiled block.
 
-        # If no output was returned, check for sub tags
-        if tag_output is None:
-            if len(self._sub_tag_matche_list) > 0:
-                self._current_sub_tag_index += 1
+        Note:
+            Compiled blocks are shared between renders, so rendering
+            does not modify the block.
 
-                return self.render(template_str, context)
+        Args:
+            context (`Dict[str, Any]`): The context to render the block
+                with.
 
-            tag_output = ''
+        Returns:
+            `str`: The rendered block.
+        """
 
-        # Render the returned block contents
-        nested_template = Template()
-        nested_template.set_template_str(tag_output)
+        # Use the output of the first tag returning any, e.g. the first
+        # true branch of an if
+        for tag_function, block_contents, tag_args in self._section_list:
+            tag_output: Optional[str] = tag_function(
+                context, block_contents, tag_args
+            )
+
+            if tag_output is not None:
+                break
+
+        else:
+            return ''
 
-        nested_raw_contents = TemplateRenderer(
-            nested_template
-        )._render_raw(context)
+        # Output without tags or comments, such as a rendered for loop,
+        # needs no nested render
+        if '{%' not in tag_output and '{#' not in tag_output:
+            return tag_output
 
-        return nested_raw_contents, end_tag_end
+        # Render the returned block contents
+        return TemplateRenderer.from_str(tag_output)._render_raw(context)
 
 
 class BlockTagContents(str):
@@ -207,27 +255,139 @@ class BlockTagContents(str):
             `str`: The rendered contents.
         """
 
-        nested_template = Template()
-        nested_template.set_template_str(self)
+        return TemplateRenderer.from_str(self)._render_raw(context)
+
+
+@lru_cache(maxsize=512)
+def _compile(template_str: str) -> Tuple[Any, ...]:
+    """Compiles a template string into the parts rendered for each
+        context.
+
+    Note:
+        Each part is either literal text, an inline tag function and its
+            arguments, or a compiled `_TagLogicBlock`. Compiled
+            templates are cached by template string.
+
+    Args:
+        template_str (`str`): The template string to compile.
+
+    Returns:
+        `Tuple[Any, ...]`: The compiled template parts.
+
+    Raises:
+        `UnknownTagException`: If a tag is not recognized.
+        `UnclosedBlockException`: If a block is not closed.
+    """
+
+    part_list = []
+
+    # Keep track of where to append from
+    next_start_index = 0
+
+    # Keep track of opened blocks to await ends, acts as queue
+    opened_block = None
+
+    # Find instances of functional syntax and comments
+    for match in _TAG_SYNTAX.finditer(template_str):
+        match_start, match_end = match.span()
+
+        # Drop comments, leaving those in blocks to the nested render
+        if match.lastgroup == 'comment':
+            if opened_block is None:
+                part_list.append(template_str[next_start_index:match_start])
+                next_start_index = match_end
+
+            continue
 
-        nested_raw_contents = TemplateRenderer(
-            nested_template
-        )._render_raw(context)
+        # Deconstruct the tag
+        tag_name, tag_args = _deconstruct_tag(match)
 
-        return nested_raw_contents
+        # If no blocks are open, append the template string up to the
+        # start of the match
+        if opened_block is None:
+            # Append the template string up to the start of the match
+            part_list.append(template_str[next_start_index:match_start])
+
+            next_start_index = match_end
+
+        else:
+            # Try to add sub tag first (e.g. elif, else)
+            if not opened_block.try_add_sub_tag(
+                match,
+                tag_name,
+                tag_args,
+            ):
+                # If no sub tag added, check for closing tag
+                if opened_block.check_closing_tag(match, tag_name):
+                    # If closing tag found, compile block
+                    next_start_index = opened_block.compile(template_str)
+                    part_list.append(opened_block)
+
+                    opened_block = None
+
+            continue
+
+        tag = get_tag(tag_name)
+
+        if isinstance(tag, BlockTag):
+            opened_block = _TagLogicBlock(match, tag_name, tag_args)
+
+        elif isinstance(tag, InlineTag):
+            # Keep the template function to call with the parsed args
+            part_list.append((tag.tag_function, tag_args))
+
+        else:
+            # If all aboce fails, tag is unknown
+            raise exception.UnknownTagException(
+                f'Unknown tag {tag_name}'
+            )
+
+    if opened_block is not None:
+        raise exception.UnclosedBlockTagException(
+            f'Unclosed block "{opened_block.tag}"'
+        )
+
+    # Append the rest of the template string
+    part_list.append(template_str[next_start_index:])
+
+    return tuple(part for part in part_list if part != '')
+
+
+def clear():
+    """Clear the compiled templates."""
+
+    _compile.cache_clear()
 
 
 class TemplateRenderer:
     """Template renderer."""
 
-    def __init__(self, template: Template):
+    def __init__(self, template: Optional[Template]):
         """Initializes the template renderer.
 
         Args:
-            template (`str`): The template to render.
+            template (`Template` | `None`): The template to render.
         """
 
         self._template = template
+        self._template_str_override = None
+
+    @classmethod
+    def from_str(cls, template_str: str) -> 'TemplateRenderer':
+        """Creates a renderer for a template string, without a
+            `Template`.
+
+        Args:
+            template_str (`str`): The template string to render.
+
+        Returns:
+            `TemplateRenderer`: The template renderer.
+        """
+
+        renderer = cls(None)
+        renderer._template_str_override = template_str
+
+        return renderer
 
     def _preprocess(self, template_str: str, context: Dict[str, Any]
                     ) -> str:
@@ -246,77 +406,30 @@ class TemplateRenderer:
             `UnclosedBlockException`: If a block is not closed.
         """
 
-        preprocessed_template_str = ''
-
-        # Keep track of where to append from
-        next_start_index = 0
-
-        # Keep track of opened blocks to await ends, acts as queue
-        opened_block = None
-
-        # Find instances of functional syntax
-        for match in re.finditer(_LOGIC_TAG_SYNTAX, template_str):
-            match_start, match_end = match.span()
-
-            # Deconstruct the tag
-            tag_name, tag_args = _deconstruct_tag(match)
-
-            # If no blocks are open, append the template string up to the
-            # start of the match
-            if opened_block is None:
-                # Append the template string up to the start of the match
-                preprocessed_template_str += template_str[
-                    next_start_index:match_start
-                ]
-
-                next_start_index = match_end
-
-            else:
-                # Try to add sub tag first (e.g. elif, else)
-                if not opened_block.try_add_sub_tag(match):
-                    # If no sub tag added, check for closing tag
-                    if opened_block.check_closing_tag(match):
-                        # If closing tag found, render block
-                        block_str, block_end = opened_block.render(
-                            template_str,
-                            context,
-                        )
-
-                        next_start_index = block_end
-                        preprocessed_template_str += block_str
-
-                        opened_block = None
-
-                continue
+        # Templates without tags or comments need no compiling
+        if '{%' not in template_str and '{#' not in template_str:
+            return template_str
 
-            if tag_is_block(tag_name):
-                opened_block = _TagLogicBlock(match)
+        # Joined once at the end to avoid repeatedly copying the output
+        preprocessed_part_list = []
 
-            elif tag_is_inline(tag_name):
-                # Get the template function and call it passing
-                # parsed args
+        # Bind frequently used lookups to locals for the loop below
+        _isinstance = isinstance
+        append = preprocessed_part_list.append
 
-                tag_function = get_tag_function(tag_name)
+        for part in _compile(template_str):
+            if _isinstance(part, str):
+                append(part)
 
-                preprocessed_template_str += tag_function(
-                    context, tag_args
-                )
+            elif _isinstance(part, _TagLogicBlock):
+                append(part.render(context))
 
             else:
-                # If all aboce fails, tag is unknown
-                raise exception.UnknownTagException(
-                    f'Unknown tag {tag_name}'
-                )
-
-        if opened_block is not None:
-            raise exception.UnclosedBlockTagException(
-                f'Unclosed block "{opened_block.tag}"'
-            )
+                tag_function, tag_args = part
 
-        # Append the rest of the template string
-        preprocessed_template_str += template_str[next_start_index:]
+                append(tag_function(context, tag_args))
 
-        return preprocessed_template_str
+        return ''.join(preprocessed_part_list)
 
     def _render_raw(self, context: Dict[str, Any]) -> str:
         """Renders the template without formatting.
@@ -325,14 +438,14 @@ class TemplateRenderer:
             `str`: The rendered template before substitution.
         """
 
-        template_str = self._template.template_str
+        template_str = self._template_str_override
+
+        if template_str is None and self._template is not None:
+            template_str = self._template.template_str
 
         if template_str is None:
             return ''
 
-        # Remove comments
-        template_str = re.sub(_COMMENT_TAG_SYNTAX, '', template_str)
-
         # Preprocess the template string
         template_str = self._preprocess(template_str, context)
 
@@ -342,11 +455,19 @@ class TemplateRenderer:
         """Renders the template with the given context.
 
         Args:
-            **context (`Any`, optional): The context to render the template
-                with.
+            context (`Dict[str, Any]`): The context to render the
+                template with.
 
         Returns:
             `str`: The rendered template.
         """
 
-        return self._render_raw(context).format(**context)
+        raw_template_str = self._render_raw(context)
+
+        # Without braces there is nothing to substitute or unescape
+        if '{' not in raw_template_str and '}' not in raw_template_str:
+            return raw_template_str
+
+        # format_map looks fields up in the context directly instead of
+        # copying it into keyword arguments
+        return raw_template_str.format_map(context)
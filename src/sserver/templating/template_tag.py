@@ -1,6 +1,7 @@
 """Template tags called in templates."""
 
 
+from collections import ChainMap
 from typing import List, Optional
 from sserver.templating import (
     register_inline_tag,
@@ -198,22 +199,31 @@ def for_block(context: Context, block_contents:
             'for tag expects identifier as first argument'
         )
 
-    if not hasattr(iterable, '__iter__'):
+    try:
+        iterator = iter(iterable)
+
+    except TypeError:
         raise exception.TemplateArgumentException(
             'for tag expects iterable as third argument'
         )
 
-    output = ''
+    output_list = []
+
+    # Bodies without tags or comments only need their fields substituted
+    if '{%' not in block_contents and '{#' not in block_contents:
+        render = block_contents.format_map
+
+    else:
+        render = TemplateRenderer.from_str(block_contents).render
 
-    for item in iterable:
-        template = Template()
-        template.set_template_str(block_contents)
+    # Layer the loop variable over the context rather than copying the
+    # context for every item
+    loop_map = {}
+    loop_context = ChainMap(loop_map, context)
 
-        renderer = TemplateRenderer(template)
+    for item in iterator:
+        loop_map[identifier.name] = item
 
-        output += renderer.render({
-            **context,
-            identifier.name: item,
-        })
+        output_list.append(render(loop_context))
 
-    return output
+    return ''.join(output_list)
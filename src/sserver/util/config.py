@@ -15,6 +15,11 @@ from sserver.path import path
 __CONFIG_CACHE_KEY = 'sserver.config'
 
 
+# In process copy of the cached config, avoiding a cache round trip on
+# every lookup
+__loaded_config = None
+
+
 # Idealy this should remain empty, providing maximum configuration to the
 # developer
 __SSERVER_CONFIG = {
@@ -43,8 +48,11 @@ __APP_DEFAULT_CONFIG = {
 def clear():
     """Clear the config."""
 
+    global __loaded_config
+
     log.info('Clearing config')
     cache.delete('config')
+    __loaded_config = None
 
 
 def load(filename: str = 'config.ini', include_default_config: bool = True):
@@ -61,6 +69,8 @@ def load(filename: str = 'config.ini', include_default_config: bool = True):
         TypeError: If  `include_default_config` is not a boolean.
     """
 
+    global __loaded_config
+
     # Check filename and include_default_config
     if not isinstance(filename, str):
         raise TypeError('config_filename must be of type str')
@@ -163,6 +173,8 @@ def load(filename: str = 'config.ini', include_default_config: bool = True):
         f'{__CONFIG_CACHE_KEY}_package_manifest': config_package_manifest
     })
 
+    __loaded_config = config
+
 
 def get_evaluated_config_as_dict(config_parser: ConfigParser
                                  ) -> Dict[Any, Union[str, int, float, bool]]:
@@ -316,11 +328,19 @@ def get_app_config(app_name: str, use_default: bool = False
     Raises:
         TypeError: If the `app_name` is not a string.
 
+    Note:
+        The returned config is shared between callers and must not be
+        modified.
+
     Returns:
         `Dict[Any, Union[str, int, float, bool]]`: The app config.
     """
 
-    log.info('Fetching app with name', app_name)
+    global __loaded_config
+
+    # Checked here as this runs for every config lookup
+    if log.verbose:
+        log.debug('Fetching app with name', app_name)
 
     if not isinstance(app_name, str):
         raise TypeError('app_name must be of type str')
@@ -328,7 +348,10 @@ def get_app_config(app_name: str, use_default: bool = False
     if not isinstance(use_default, bool):
         raise TypeError('use_default must be of type bool')
 
-    config = cache.get(__CONFIG_CACHE_KEY).get(app_name)
+    if __loaded_config is None:
+        __loaded_config = cache.get(__CONFIG_CACHE_KEY)
+
+    config = __loaded_config.get(app_name)
 
     if config is None and use_default:
         # A shallow copy is valid here as app configs are never nested
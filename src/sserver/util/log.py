@@ -3,6 +3,8 @@
 Attributes:
     delimiter (`str`): The delimiter to use for the log message
         between the message and the context, default ' : '
+    verbose (`bool`): Whether or not to display debug messages, default
+        False
 """
 
 import sys
@@ -22,6 +24,9 @@ class __Empty__:
 delimiter: str = ' : '
 
 
+verbose: bool = False
+
+
 def info(text: str, context: Any = __Empty__):
     """Display unformatted `text` to the console
     alongside formatted `context`, if passed.
@@ -46,6 +51,24 @@ def info(text: str, context: Any = __Empty__):
     sys.stdout.write('\n')
 
 
+def debug(text: str, context: Any = __Empty__):
+    """Display unformatted `text` to the console alongside formatted
+    `context`, if passed, only when `verbose` is True.
+
+    Note:
+        Use for messages emitted while handling requests, so they cost
+        no more than a function call unless debugging.
+
+    Args:
+        text (`str`): The text to display as debug information.
+        context (`Any`, optional): The value to be formatted and displayed
+            along with the `text`. Defaults to __Empty__.
+    """
+
+    if verbose:
+        info(text, context)
+
+
 def log(value: Any, context: Any = __Empty__):
     """Display formatted `value` to the console
     alongside formatted `context`, if passed.
@@ -0,0 +1,164 @@
+import asyncio
+import unittest
+from unittest import mock
+
+
+from sserver import asgi
+
+
+def run(coroutine):
+    """Run `coroutine` to completion on a new event loop."""
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+
+    finally:
+        loop.close()
+
+
+def get_receive(message_list):
+    """Get a receive callable returning each message in turn."""
+
+    message_iter = iter(message_list)
+
+    async def receive():
+        return next(message_iter)
+
+    return receive
+
+
+def get_send(sent_list):
+    """Get a send callable collecting each message sent."""
+
+    async def send(message):
+        sent_list.append(message)
+
+    return send
+
+
+class ASGITest(unittest.TestCase):
+    """Unittest the sserver.asgi module."""
+
+    def test_get_environment(self):
+        """Test the WSGI environment built from a scope."""
+
+        environment = asgi.get_environment(
+            {
+                'type': 'http',
+                'method': 'POST',
+                'path': '/submit',
+                'query_string': b'a=1&b=2',
+                'headers': [
+                    (b'content-type', b'application/json'),
+                    (b'content-length', b'999'),
+                    (b'x-request-id', b'abc'),
+                ],
+            },
+            b'{"a": 1}',
+        )
+
+        self.assertEqual(environment['REQUEST_METHOD'], 'POST')
+        self.assertEqual(environment['PATH_INFO'], '/submit')
+        self.assertEqual(environment['QUERY_STRING'], 'a=1&b=2')
+        self.assertEqual(environment['REQUEST_URI'], '/submit?a=1&b=2')
+        self.assertEqual(environment['CONTENT_TYPE'], 'application/json')
+        self.assertEqual(environment['HTTP_X_REQUEST_ID'], 'abc')
+        self.assertNotIn('HTTP_CONTENT_TYPE', environment)
+
+        # The length of the body read is kept over the header
+        self.assertEqual(environment['CONTENT_LENGTH'], '8')
+        self.assertEqual(environment['wsgi.input'].read(), b'{"a": 1}')
+
+    def test_get_environment_no_query_string(self):
+        """Test the request uri is the path without a query string."""
+
+        environment = asgi.get_environment(
+            {'type': 'http', 'method': 'GET', 'path': '/'},
+            b'',
+        )
+
+        self.assertEqual(environment['QUERY_STRING'], '')
+        self.assertEqual(environment['REQUEST_URI'], '/')
+        self.assertEqual(environment['CONTENT_LENGTH'], '0')
+
+    def test_handle_http(self):
+        """Test a request is passed to the WSGI application and its
+        response sent back."""
+
+        def application(environment, start_response):
+            start_response('201 Created', [('Content-Type', 'text/plain')])
+            return [
+                environment['REQUEST_METHOD'].encode(),
+                environment['wsgi.input'].read(),
+            ]
+
+        sent_list = []
+        receive = get_receive([
+            {'type': 'http.request', 'body': b'he', 'more_body': True},
+            {'type': 'http.request', 'body': b'llo'},
+        ])
+
+        with mock.patch.object(asgi.server, 'application', application):
+            run(asgi.application(
+                {'type': 'http', 'method': 'PUT', 'path': '/'},
+                receive,
+                get_send(sent_list),
+            ))
+
+        self.assertEqual(sent_list, [
+            {
+                'type': 'http.response.start',
+                'status': 201,
+                'headers': [(b'Content-Type', b'text/plain')],
+            },
+            {'type': 'http.response.body', 'body': b'PUThello'},
+        ])
+
+    def test_lifespan(self):
+        """Test the server is initialized on startup."""
+
+        sent_list = []
+        receive = get_receive([
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ])
+
+        with mock.patch.object(asgi.server, 'initialize') as initialize:
+            run(asgi.application(
+                {'type': 'lifespan'},
+                receive,
+                get_send(sent_list),
+            ))
+
+        initialize.assert_called_once_with()
+        self.assertEqual(sent_list, [
+            {'type': 'lifespan.startup.complete'},
+            {'type': 'lifespan.shutdown.complete'},
+        ])
+
+    def test_lifespan_startup_failed(self):
+        """Test an error initializing is reported as a failed startup."""
+
+        sent_list = []
+        receive = get_receive([{'type': 'lifespan.startup'}])
+
+        with mock.patch.object(
+            asgi.server,
+            'initialize',
+            side_effect=RuntimeError('no config'),
+        ):
+            run(asgi.application(
+                {'type': 'lifespan'},
+                receive,
+                get_send(sent_list),
+            ))
+
+        self.assertEqual(sent_list, [
+            {'type': 'lifespan.startup.failed', 'message': 'no config'},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import threading
+import time
+import unittest
+
+
+from sserver.endpoint.batch import batchable
+
+
+class BatchableTest(unittest.TestCase):
+    """Unittest the sserver.endpoint.batch module."""
+
+    def test_single_request(self):
+        """Test a single request is handled as a batch of one."""
+
+        class Endpoint:
+            @batchable(max_wait_ms=0)
+            def post(self, request_list):
+                return [request * 2 for request in request_list]
+
+        self.assertEqual(Endpoint().post(4), 8)
+
+    def test_concurrent_requests(self):
+        """Test concurrent requests are batched and each gets its own
+        response."""
+
+        batch_size_list = []
+
+        class Endpoint:
+            @batchable(max_batch_size=4, max_wait_ms=500)
+            def post(self, request_list):
+                batch_size_list.append(len(request_list))
+                return [request * 2 for request in request_list]
+
+        response_map = {}
+
+        def send(request):
+            response_map[request] = Endpoint().post(request)
+
+        thread_list = [
+            threading.Thread(target=send, args=(request,))
+            for request in range(4)
+        ]
+
+        for thread in thread_list:
+            thread.start()
+
+        for thread in thread_list:
+            thread.join()
+
+        self.assertEqual(response_map, {0: 0, 1: 2, 2: 4, 3: 6})
+        self.assertEqual(batch_size_list, [4])
+
+    def test_processor_hands_off_queue(self):
+        """Test the processing caller returns once its own request is
+        handled, leaving the queue to the waiting callers."""
+
+        handler_map = {}
+        queued = threading.Event()
+
+        class Endpoint:
+            @batchable(max_batch_size=1, max_wait_ms=0)
+            def post(self, request_list):
+                if request_list == ['a']:
+                    queued.wait()
+
+                handler_map[request_list[0]] = (
+                    threading.current_thread().name
+                )
+                return request_list
+
+        response_map = {}
+
+        def send(request):
+            response_map[request] = Endpoint().post(request)
+
+        thread_list = [
+            threading.Thread(target=send, args=(request,), name=request)
+            for request in ('a', 'b', 'c')
+        ]
+
+        thread_list[0].start()
+
+        # Let the first request become the processor before queueing
+        # the others behind it
+        time.sleep(0.05)
+        thread_list[1].start()
+        thread_list[2].start()
+        time.sleep(0.05)
+        queued.set()
+
+        for thread in thread_list:
+            thread.join(timeout=5)
+
+        self.assertEqual(response_map, {'a': 'a', 'b': 'b', 'c': 'c'})
+        self.assertEqual(handler_map['a'], 'a')
+        self.assertNotEqual(handler_map['b'], 'a')
+        self.assertNotEqual(handler_map['c'], 'a')
+
+    def test_hand_off_skips_fill_wait(self):
+        """Test a caller taking over the queue does not wait for its
+        batch to fill again once its request has waited `max_wait_ms`."""
+
+        release = threading.Event()
+        handled_at_map = {}
+
+        class Endpoint:
+            @batchable(max_batch_size=2, max_wait_ms=300)
+            def post(self, request_list):
+                if request_list == ['a']:
+                    release.wait()
+
+                handled_at_map[request_list[0]] = time.monotonic()
+                return request_list
+
+        thread_list = [
+            threading.Thread(target=Endpoint().post, args=(request,))
+            for request in ('a', 'b')
+        ]
+
+        thread_list[0].start()
+
+        # Queue the second request once the first batch is being handled
+        time.sleep(0.35)
+        thread_list[1].start()
+
+        # Let the second request wait longer than max_wait_ms
+        time.sleep(0.35)
+        released_at = time.monotonic()
+        release.set()
+
+        for thread in thread_list:
+            thread.join(timeout=5)
+
+        self.assertLess(handled_at_map['b'] - released_at, 0.15)
+
+    def test_error_raised_for_each_request(self):
+        """Test an error handling a batch is raised to the caller."""
+
+        class Endpoint:
+            @batchable(max_wait_ms=0)
+            def post(self, request_list):
+                raise KeyError('missing')
+
+        with self.assertRaises(KeyError):
+            Endpoint().post(1)
+
+    def test_response_count_mismatch(self):
+        """Test a batch returning the wrong number of responses."""
+
+        class Endpoint:
+            @batchable(max_wait_ms=0)
+            def post(self, request_list):
+                return []
+
+        with self.assertRaises(ValueError):
+            Endpoint().post(1)
+
+    def test_invalid_arguments(self):
+        """Test invalid decorator arguments."""
+
+        with self.assertRaises(ValueError):
+            batchable(max_batch_size=0)
+
+        with self.assertRaises(ValueError):
+            batchable(max_wait_ms=-1)
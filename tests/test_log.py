@@ -1,4 +1,6 @@
+import io
 import unittest
+from contextlib import redirect_stdout
 
 
 from sserver.util import log
@@ -7,6 +9,32 @@ from sserver.util import log
 class LoggerTest(unittest.TestCase):
     """Unittest the sserver.util.log module."""
 
+    def test_debug_not_verbose(self):
+        """Test sserver.util.log.debug displays nothing when not verbose."""
+
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            log.debug('text', 'context')
+
+        self.assertEqual(output.getvalue(), '')
+
+    def test_debug_verbose(self):
+        """Test sserver.util.log.debug displays when verbose."""
+
+        output = io.StringIO()
+
+        log.verbose = True
+
+        try:
+            with redirect_stdout(output):
+                log.debug('text', 'context')
+
+        finally:
+            log.verbose = False
+
+        self.assertEqual(output.getvalue(), 'text : "context"\n')
+
     def test_format_int(self):
         """Test sserver.util.log.format_int."""
 
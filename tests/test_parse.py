@@ -0,0 +1,55 @@
+import unittest
+from collections import UserDict
+
+
+from sserver import parse
+from sserver.parse import base_literal
+
+
+class ParseTest(unittest.TestCase):
+    """Unittest the sserver.parse module."""
+
+    @classmethod
+    def setUpClass(cls):
+        parse.load()
+
+    def tearDown(self):
+        base_literal._constant_operator_map.pop('PI', None)
+        parse.parse_string_to_expression.cache_clear()
+
+    def test_constant_operator_added_after_parse(self):
+        """Test an expression parsed before a constant operator is
+            added sees the operator afterwards.
+        """
+
+        self.assertIsNone(parse.parse_string_to_value({}, 'PI'))
+
+        base_literal.add_constant_operator('PI', 3.14)
+
+        self.assertEqual(parse.parse_string_to_value({}, 'PI'), 3.14)
+
+    def test_identifier_not_found(self):
+        """Test identifiers missing from the context, or looked up on a
+            value that is not a mapping, evaluate to None.
+        """
+
+        context = {'name': 'value', 'user': {'id': 1}}
+
+        self.assertIsNone(parse.parse_string_to_value(context, 'missing'))
+        self.assertIsNone(parse.parse_string_to_value(context, 'user.name'))
+        self.assertIsNone(parse.parse_string_to_value(context, 'name.a'))
+        self.assertEqual(parse.parse_string_to_value(context, 'user.id'), 1)
+
+    def test_identifier_mapping_error_raised(self):
+        """Test an error raised by a mapping lookup is not swallowed."""
+
+        class BrokenMapping(UserDict):
+            def __getitem__(self, key):
+                raise TypeError('broken lookup')
+
+        with self.assertRaisesRegex(TypeError, 'broken lookup'):
+            parse.parse_string_to_value(BrokenMapping(), 'name')
+
+
+if __name__ == '__main__':
+    unittest.main()
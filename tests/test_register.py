@@ -0,0 +1,27 @@
+import unittest
+
+
+from sserver import templating
+from sserver.templating import exception, register
+
+
+class RegisterTest(unittest.TestCase):
+    """Unittest the sserver.templating.register module."""
+
+    @classmethod
+    def setUpClass(cls):
+        templating.load()
+
+    def test_register_duplicate_sub_tag(self):
+        """Test a sub tag name already in use cannot be registered."""
+
+        with self.assertRaises(exception.TagAlreadyRegisteredException):
+            @register.register_block_tag('when', 'endwhen', ['else'])
+            def when_block(*args):
+                pass
+
+        self.assertIsNone(register.get_tag('when'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+
+
+from sserver import server
+
+
+class InitializeTest(unittest.TestCase):
+    """Unittest sserver.server.initialize."""
+
+    def setUp(self):
+        server._initialized = False
+        server._completed_load_count = 0
+
+    def tearDown(self):
+        server._initialized = False
+        server._completed_load_count = 0
+
+    def test_retry_after_failed_load(self):
+        """Test a failed load is retried from the step that failed."""
+
+        module_map = {
+            name: mock.patch.object(server, name).start()
+            for name in ('config', 'route', 'static', 'parse', 'templating')
+        }
+        self.addCleanup(mock.patch.stopall)
+
+        module_map['route'].load.side_effect = [
+            RuntimeError('bad route'),
+            None,
+        ]
+
+        with self.assertRaisesRegex(RuntimeError, 'bad route'):
+            server.initialize()
+
+        self.assertFalse(server._initialized)
+        module_map['static'].load.assert_not_called()
+
+        server.initialize()
+        server.initialize()
+
+        self.assertTrue(server._initialized)
+        self.assertEqual(module_map['config'].load.call_count, 1)
+        self.assertEqual(module_map['route'].load.call_count, 2)
+
+        for name in ('static', 'parse', 'templating'):
+            self.assertEqual(module_map[name].load.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
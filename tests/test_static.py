@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+
+from sserver.path import static
+
+
+class StaticTest(unittest.TestCase):
+    """Unittest the sserver.path.static module."""
+
+    def setUp(self):
+        static._lookup_static_file_path.cache_clear()
+
+        self.static_cache = mock.Mock()
+        self.static_cache.get.return_value = {
+            '/main/static/app.css': 'apps/main/static/app.css',
+        }
+
+        for patcher in (
+            mock.patch.object(static, 'cache', self.static_cache),
+            mock.patch.object(
+                static,
+                '_static_prefix_tuple',
+                ('/main/static/',),
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.reload = mock.patch.object(
+            static,
+            '_load_static_path_map',
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def tearDown(self):
+        static._lookup_static_file_path.cache_clear()
+
+    def test_get_static_file_path_reloads_once_per_path(self):
+        """Test a path that is not a static file only reloads once, even
+        alongside other missing paths."""
+
+        for _ in range(5):
+            self.assertIsNone(
+                static.get_static_file_path('/main/static/a.css')
+            )
+            self.assertIsNone(
+                static.get_static_file_path('/main/static/b.css')
+            )
+            self.assertEqual(
+                static.get_static_file_path('/main/static/app.css'),
+                'apps/main/static/app.css',
+            )
+
+        self.assertEqual(self.reload.call_count, 2)
+
+    def test_get_static_file_path_ignores_query_string(self):
+        """Test the query string does not affect the lookup."""
+
+        for version in range(5):
+            self.assertEqual(
+                static.get_static_file_path(
+                    f'/main/static/app.css?v={version}'
+                ),
+                'apps/main/static/app.css',
+            )
+
+        self.reload.assert_not_called()
+        self.assertEqual(
+            static._lookup_static_file_path.cache_info().currsize,
+            1,
+        )
+
+    def test_get_static_file_path_outside_prefix(self):
+        """Test paths outside the static folders are rejected without a
+        lookup."""
+
+        for path in ('/home', '/home?x=1', '/main/templates/a.css'):
+            self.assertIsNone(static.get_static_file_path(path))
+
+        self.static_cache.get.assert_not_called()
+        self.reload.assert_not_called()
+
+
+class LoadStaticPathMapTest(unittest.TestCase):
+    """Unittest loading the static path map."""
+
+    def setUp(self):
+        working_directory = os.getcwd()
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        os.chdir(temporary_directory.name)
+        self.addCleanup(os.chdir, working_directory)
+
+        self.static_cache = mock.Mock()
+        config_map = {'app_folder': 'apps', 'static_folder': 'static'}
+
+        for patcher in (
+            mock.patch.object(static, 'cache', self.static_cache),
+            mock.patch.object(static, '_static_prefix_tuple', ()),
+            mock.patch.object(static.config, 'get', config_map.get),
+            mock.patch.object(
+                static.config,
+                'get_app_config',
+                return_value={'static_folder': 'static'},
+            ),
+            mock.patch.object(
+                static.path,
+                'get_directory_list',
+                return_value=['main'],
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_app_folder_name_deeper_in_path(self):
+        """Test only the leading app folder is removed from the key when
+        the folder name also appears deeper in the path."""
+
+        file_path = os.path.join('apps', 'main', 'static', 'apps', 'a.css')
+        os.makedirs(os.path.dirname(file_path))
+        open(file_path, 'w').close()
+
+        static._load_static_path_map()
+
+        self.static_cache.set.assert_called_once_with('__static__', {
+            os.path.join(os.sep, 'main', 'static', 'apps', 'a.css'):
+                file_path,
+        })
+        self.assertEqual(
+            static._static_prefix_tuple,
+            (os.path.join(os.sep, 'main', 'static', ''),),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
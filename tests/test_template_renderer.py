@@ -0,0 +1,75 @@
+import unittest
+
+
+from sserver import parse, templating
+from sserver.templating import Template, TemplateRenderer, exception
+
+
+class TemplateRendererTest(unittest.TestCase):
+    """Unittest the sserver.templating.template_renderer module."""
+
+    @classmethod
+    def setUpClass(cls):
+        parse.load()
+        templating.load()
+
+    def render(self, template_str, context):
+        template = Template()
+        template.set_template_str(template_str)
+
+        return TemplateRenderer(template).render(context)
+
+    def test_render_tags_on_one_line(self):
+        """Test several tags on one line are matched separately."""
+
+        self.assertEqual(
+            self.render(
+                '{% if a == 1 %}one{% else %}other{% endif %}!',
+                {'a': 1},
+            ),
+            'one!',
+        )
+
+    def test_render_no_true_branch(self):
+        """Test a block with no true branch renders nothing."""
+
+        self.assertEqual(
+            self.render(
+                'a{% if False %}\nx{% elif False %}\ny{% endif %}\nb',
+                {},
+            ),
+            'a\nb',
+        )
+
+    def test_render_comments(self):
+        """Test only the comments are removed."""
+
+        self.assertEqual(
+            self.render('a{# one #}b{# two\nlines #}c', {}),
+            'abc',
+        )
+
+    def test_render_comment_in_block(self):
+        """Test a comment in a block does not keep its surrounding
+        whitespace."""
+
+        self.assertEqual(
+            self.render(
+                '{% for i in l %}\n{# c #}\n{i}\n{% endfor %}\n',
+                {'l': [1, 2]},
+            ),
+            '12\n',
+        )
+
+    def test_render_empty_tag(self):
+        """Test a tag with no name is reported as empty."""
+
+        for template_str in ('a{%  %}b', 'a{%\t\n %}b'):
+            with self.assertRaises(exception.UnknownTagException) as error:
+                self.render(template_str, {})
+
+            self.assertEqual(str(error.exception), 'Empty tag')
+
+
+if __name__ == '__main__':
+    unittest.main()